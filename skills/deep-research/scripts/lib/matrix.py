@@ -45,9 +45,13 @@ than being used for algorithmic matching. Valid match_method values after
 this decision: 'exact', 'heading-fuzzy', 'unmatched'.
 """
 
+import functools
+import heapq
 import re
+import threading
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 # Word count threshold separating 'detailed' from 'mentioned' coverage.
 DETAILED_WORD_THRESHOLD = 100
@@ -153,12 +157,35 @@ STOP_WORDS = frozenset(
 )
 
 
+# Heading word → bit position. Shared by every Topic so that heading bitsets
+# built in different extract_topics calls remain comparable. It grows with the
+# distinct heading words seen by the process (small for a CLI run). Interning
+# is guarded so concurrent Topic construction never gives two words one bit.
+_HEADING_VOCAB: Dict[str, int] = {}
+_HEADING_VOCAB_LOCK = threading.Lock()
+
+
+def _heading_bits(tokens: FrozenSet[str]) -> int:
+    """Pack a heading word set into an int bitset, interning unseen words."""
+    bits = 0
+    for token in tokens:
+        pos = _HEADING_VOCAB.get(token)
+        if pos is None:
+            with _HEADING_VOCAB_LOCK:
+                # Re-check: another thread may have interned it meanwhile.
+                pos = _HEADING_VOCAB.get(token)
+                if pos is None:
+                    pos = _HEADING_VOCAB[token] = len(_HEADING_VOCAB)
+        bits |= 1 << pos
+    return bits
+
+
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Topic:
     """A single section extracted from a provider report.
 
@@ -170,6 +197,14 @@ class Topic:
         coverage: 'detailed' (≥100 words) or 'mentioned' (<100 words).
         citations_in_section: Number of URLs found in the section body.
         body_keywords: Significant keywords from section body (stop-word filtered).
+        heading_tokens: Lowercased word set of `heading`, derived at
+            construction and used for fuzzy heading Jaccard.
+        heading_len: len(heading_tokens), cached alongside the set.
+        heading_bits: heading_tokens as an int bitset over _HEADING_VOCAB, so
+            pairwise intersection size is a single popcount.
+
+    Slotted: reports yield many small Topics, and the matcher reads their
+    fields in its inner loop.
     """
 
     heading: str
@@ -179,9 +214,17 @@ class Topic:
     coverage: str  # 'detailed' | 'mentioned'
     citations_in_section: int
     body_keywords: Set[str] = field(default_factory=set)
+    heading_tokens: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    heading_len: int = field(init=False, repr=False, compare=False)
+    heading_bits: int = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        self.heading_tokens = frozenset(self.heading.lower().split())
+        self.heading_len = len(self.heading_tokens)
+        self.heading_bits = _heading_bits(self.heading_tokens)
 
-@dataclass
+
+@dataclass(slots=True)
 class MatchedTopic:
     """A topic cluster matched across providers.
 
@@ -263,6 +306,12 @@ class ComparisonMatrix:
 # ---------------------------------------------------------------------------
 
 
+# Characters stripped from body text before splitting into keywords (applied
+# after lowercasing). Whitespace is kept so one pass over the whole text
+# cleans every token at once.
+_NON_KEYWORD_RE = re.compile(r"[^a-z0-9\s]")
+
+
 def _extract_body_keywords(text: str) -> Set[str]:
     """Extract significant keywords from section body text.
 
@@ -274,14 +323,26 @@ def _extract_body_keywords(text: str) -> Set[str]:
         text: Raw section body text (markdown).
 
     Returns:
-        Set of cleaned keyword strings.
+        Set of cleaned keyword strings. Always a fresh mutable set, including
+        for empty input, since callers store it on Topic.body_keywords.
     """
-    words: Set[str] = set()
-    for word in text.lower().split():
-        cleaned = re.sub(r"[^a-z0-9]", "", word)
-        if cleaned and len(cleaned) > 1 and cleaned not in STOP_WORDS:
-            words.add(cleaned)
-    return words
+    if not text:
+        return set()
+    return _keywords_from_lowered(text.lower())
+
+
+def _keywords_from_lowered(lowered: str) -> Set[str]:
+    """Extract body keywords from already-lowercased text.
+
+    Punctuation is stripped from the whole text in a single regex pass and
+    the result split on whitespace, which yields the same tokens as cleaning
+    each whitespace-separated word individually. Deduplication and stop-word
+    removal are C-level set operations, so the Python-level length filter
+    only visits distinct candidate words.
+    """
+    words = set(_NON_KEYWORD_RE.sub("", lowered).split())
+    words -= STOP_WORDS
+    return {word for word in words if len(word) > 1}
 
 
 def _jaccard_similarity_sets(a: Set[str], b: Set[str]) -> float:
@@ -294,13 +355,25 @@ def _jaccard_similarity_sets(a: Set[str], b: Set[str]) -> float:
     Returns:
         Float in [0.0, 1.0]. Two empty sets → 1.0. One empty → 0.0.
     """
+    # The same bag passed twice (shared keyword sets) scores 1.0 whether or
+    # not it is empty, so skip the intersection entirely.
+    if a is b:
+        return 1.0
     if not a and not b:
         return 1.0
     if not a or not b:
         return 0.0
-    return len(a & b) / len(a | b)
+    # |A ∪ B| = |A| + |B| - |A ∩ B| — avoids materializing the union set.
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
 
 
+_BULLET_PREFIX_RE = re.compile(r"^[-*•]\s+")
+_NUMBERING_PREFIX_RE = re.compile(r"^[0-9A-Za-z]+[.)]\s+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=1024)
 def _normalize_heading(text: str) -> str:
     """Normalize a heading for comparison.
 
@@ -317,22 +390,63 @@ def _normalize_heading(text: str) -> str:
         "a. Background:"        → "background"
         "- Introduction"        → "introduction"
         "  Company Overview  "  → "company overview"
+
+    Results are memoized: provider reports repeat the same raw headings
+    ("Key Findings", "Company Overview") across sections and providers.
     """
     s = text.strip()
     # Strip leading dash or bullet
-    s = re.sub(r"^[-*•]\s+", "", s)
+    s = _BULLET_PREFIX_RE.sub("", s)
     # Strip leading numbering: "1. ", "2) ", "a. ", "A. "
-    s = re.sub(r"^[0-9A-Za-z]+[.)]\s+", "", s)
+    s = _NUMBERING_PREFIX_RE.sub("", s)
     # Strip trailing punctuation
     s = s.rstrip(":.,;!?")
     # Lowercase and collapse whitespace
-    s = re.sub(r"\s+", " ", s).strip().lower()
+    s = _WHITESPACE_RE.sub(" ", s).strip().lower()
     return s
 
 
+# Matches http/https URLs up to the next whitespace.
+_URL_RE = re.compile(r"https?://\S+")
+
+
 def _count_urls(text: str) -> int:
     """Count the number of http/https URLs in a block of text."""
-    return len(re.findall(r"https?://\S+", text))
+    return len(_URL_RE.findall(text))
+
+
+def _scan_section(body: str) -> Tuple[int, Set[str], int]:
+    """Compute (word_count, body_keywords, citation_count) for a section body.
+
+    The word count splits the raw body on whitespace. Keywords come from a
+    separate pass: the lowercased body has punctuation stripped in one regex
+    sweep and is then split. The two splits cannot share a token list, since
+    stripping punctuation changes tokenization (a lone "-" vanishes, so
+    "a - b" is three words but yields only two keyword tokens).
+    URLs are counted on the original text so the case-sensitive scheme match
+    is unchanged.
+    """
+    # Back-to-back headings leave empty or whitespace-only bodies.
+    if not body or body.isspace():
+        return 0, set(), 0
+    return len(body.split()), _keywords_from_lowered(body.lower()), _count_urls(body)
+
+
+def _heading_jaccard(a: Topic, b: Topic) -> float:
+    """Jaccard similarity between two topics' heading word sets.
+
+    Same semantics as _jaccard_similarity on the normalized headings, but the
+    intersection size is a popcount over the precomputed heading bitsets.
+    """
+    # Identical word sets (including reordered headings) need no popcount.
+    if a.heading_bits == b.heading_bits:
+        return 1.0
+    if not a.heading_len and not b.heading_len:
+        return 1.0
+    if not a.heading_len or not b.heading_len:
+        return 0.0
+    inter = (a.heading_bits & b.heading_bits).bit_count()
+    return inter / (a.heading_len + b.heading_len - inter)
 
 
 def _jaccard_similarity(a: str, b: str) -> float:
@@ -349,9 +463,8 @@ def _jaccard_similarity(a: str, b: str) -> float:
     if not words_a or not words_b:
         return 0.0
 
-    intersection = words_a & words_b
-    union = words_a | words_b
-    return len(intersection) / len(union)
+    inter = len(words_a & words_b)
+    return inter / (len(words_a) + len(words_b) - inter)
 
 
 # ---------------------------------------------------------------------------
@@ -382,7 +495,7 @@ def extract_topics(report: str) -> List[Topic]:
 
     if not matches:
         # Flat text — treat entire report as one implicit topic.
-        word_count = len(report.split())
+        word_count, body_keywords, citation_count = _scan_section(report)
         coverage = "detailed" if word_count >= DETAILED_WORD_THRESHOLD else "mentioned"
         return [
             Topic(
@@ -391,8 +504,8 @@ def extract_topics(report: str) -> List[Topic]:
                 level=1,
                 word_count=word_count,
                 coverage=coverage,
-                citations_in_section=_count_urls(report),
-                body_keywords=_extract_body_keywords(report),
+                citations_in_section=citation_count,
+                body_keywords=body_keywords,
             )
         ]
 
@@ -408,9 +521,8 @@ def extract_topics(report: str) -> List[Topic]:
         body_end = matches[i + 1].start() if i + 1 < len(matches) else len(report)
         body = report[body_start:body_end]
 
-        word_count = len(body.split())
+        word_count, body_keywords, citation_count = _scan_section(body)
         coverage = "detailed" if word_count >= DETAILED_WORD_THRESHOLD else "mentioned"
-        citation_count = _count_urls(body)
 
         topics.append(
             Topic(
@@ -420,7 +532,7 @@ def extract_topics(report: str) -> List[Topic]:
                 word_count=word_count,
                 coverage=coverage,
                 citations_in_section=citation_count,
-                body_keywords=_extract_body_keywords(body),
+                body_keywords=body_keywords,
             )
         )
 
@@ -432,10 +544,19 @@ def extract_topics(report: str) -> List[Topic]:
 # ---------------------------------------------------------------------------
 
 
+def _index_by_heading(topics: List[Topic]) -> Dict[str, List[int]]:
+    """Bucket topic indices by normalized heading, preserving report order."""
+    index: Dict[str, List[int]] = defaultdict(list)
+    for idx, topic in enumerate(topics):
+        index[topic.heading].append(idx)
+    return index
+
+
 def _best_match(
     needle: Topic,
     candidates: List[Topic],
     used: Set[int],
+    by_heading: Dict[str, List[int]],
 ) -> Optional[Tuple[int, float]]:
     """Find the best heading-based match for `needle` among unused candidates.
 
@@ -443,20 +564,38 @@ def _best_match(
     or None if no suitable match exists.
 
     Score 1.0 indicates an exact match; scores below 1.0 are heading-fuzzy.
+
+    Exact matches are a single lookup in `by_heading` (see _index_by_heading,
+    built over `candidates`). If that finds no unused candidate, none of the
+    remaining candidates share the needle's heading, so the fuzzy scan only
+    computes Jaccard scores from the heading bitsets precomputed on each Topic.
     """
+    for idx in by_heading.get(needle.heading, ()):
+        if idx not in used:
+            return (idx, 1.0)
+
     best_idx: Optional[int] = None
     best_score = FUZZY_MATCH_THRESHOLD - 1e-9  # just below threshold
+    needle_len = needle.heading_len
 
     for idx, candidate in enumerate(candidates):
         if idx in used:
             continue
-        # Try exact match first.
-        if needle.heading == candidate.heading:
-            return (idx, 1.0)
-        score = _jaccard_similarity(needle.heading, candidate.heading)
+        # Jaccard is bounded by min(|A|, |B|) / max(|A|, |B|); skip candidates
+        # whose size ratio alone cannot beat the current best score.
+        candidate_len = candidate.heading_len
+        longest = max(needle_len, candidate_len)
+        if longest and min(needle_len, candidate_len) / longest <= best_score:
+            continue
+        score = _heading_jaccard(needle, candidate)
         if score > best_score:
             best_score = score
             best_idx = idx
+            # Nothing can beat a perfect word-set match (e.g. reordered
+            # headings); later candidates would only tie, and ties keep the
+            # earliest index.
+            if score >= 1.0:
+                break
 
     if best_idx is not None and best_score >= FUZZY_MATCH_THRESHOLD:
         return (best_idx, best_score)
@@ -472,7 +611,9 @@ def match_topics(
 
     1. For each provider in insertion order, iterate its topics.
     2. For each topic, attempt an exact then heading-fuzzy match against every
-       other provider's topic list (only unmatched topics considered).
+       other provider's topic list (only unmatched topics considered). Exact
+       matches are resolved through a per-provider heading index; only topics
+       without an exact partner fall through to the fuzzy scan.
     3. All matched topics form one cluster. match_method is 'exact' for
        score==1.0, 'heading-fuzzy' for scores below 1.0.
     4. Topics with no heading match in any other provider get
@@ -489,15 +630,41 @@ def match_topics(
         List of MatchedTopic clusters.
     """
     providers = list(provider_topics.keys())
+    return [
+        _matched_topic_from_cluster(cluster_topics, match_method, providers)
+        for cluster_topics, match_method in _cluster_topics(provider_topics)
+    ]
+
+
+# A heading cluster: {provider: Topic or None} plus its match_method.
+_Cluster = Tuple[Dict[str, Optional[Topic]], str]
+
+
+def _cluster_topics(provider_topics: Dict[str, List[Topic]]) -> List[_Cluster]:
+    """Group topics into heading clusters (steps 1–4 of match_topics)."""
+    providers = list(provider_topics.keys())
     if not providers:
         return []
 
+    # With at most one provider contributing topics there is nothing to match
+    # against: every topic is its own unmatched cluster, so skip the heading
+    # index and the fuzzy scan entirely.
+    if sum(1 for p in providers if provider_topics[p]) <= 1:
+        clusters: List[_Cluster] = []
+        for owner in providers:
+            for topic in provider_topics[owner]:
+                cluster_topics: Dict[str, Optional[Topic]] = {p: None for p in providers}
+                cluster_topics[owner] = topic
+                clusters.append((cluster_topics, "unmatched"))
+        return clusters
+
     # Track which topics in each provider have been assigned to a cluster.
     used: Dict[str, Set[int]] = {p: set() for p in providers}
 
-    # Each cluster: maps provider → Topic (or None), plus the match_method.
-    # Format: {"topics": {provider: Topic|None}, "match_method": str}
-    clusters: List[Dict] = []
+    # Exact-match lookup tables, built once per provider.
+    heading_index = {p: _index_by_heading(provider_topics[p]) for p in providers}
+
+    clusters: List[_Cluster] = []
 
     # -----------------------------------------------------------------------
     # Pass 1: heading-based matching (exact + fuzzy)
@@ -518,7 +685,12 @@ def match_topics(
                 if other_provider == anchor_provider:
                     continue
                 other_topics = provider_topics[other_provider]
-                result = _best_match(anchor_topic, other_topics, used[other_provider])
+                result = _best_match(
+                    anchor_topic,
+                    other_topics,
+                    used[other_provider],
+                    heading_index[other_provider],
+                )
                 if result is not None:
                     match_idx, score = result
                     cluster_topics[other_provider] = other_topics[match_idx]
@@ -531,59 +703,51 @@ def match_topics(
                         if cluster_match_method == "unmatched":
                             cluster_match_method = "heading-fuzzy"
 
-            clusters.append(
-                {
-                    "topics": cluster_topics,
-                    "match_method": cluster_match_method,
-                }
-            )
+            clusters.append((cluster_topics, cluster_match_method))
 
-    # -----------------------------------------------------------------------
-    # Convert clusters to MatchedTopic instances.
-    # -----------------------------------------------------------------------
-    active_provider_count = len(providers)
-    matched: List[MatchedTopic] = []
-
-    for cluster in clusters:
-        cluster_topics = cluster["topics"]
-        match_method = cluster["match_method"]
+    return clusters
 
-        present_topics = [(p, t) for p, t in cluster_topics.items() if t is not None]
-        canonical = max(
-            (t.heading for _, t in present_topics),
-            key=len,
-        )
 
-        coverage: Dict[str, str] = {}
-        for p in providers:
-            t = cluster_topics.get(p)
-            if t is not None:
-                coverage[p] = t.coverage
-            else:
-                coverage[p] = "absent"
-
-        present_count = sum(1 for v in coverage.values() if v != "absent")
-
-        if active_provider_count == 1:
-            agreement = f"unique-{providers[0]}"
-        elif present_count == active_provider_count:
-            agreement = "consensus"
-        elif present_count >= 2:
-            agreement = "majority"
-        else:
-            only_provider = next(p for p, v in coverage.items() if v != "absent")
-            agreement = f"unique-{only_provider}"
+def _matched_topic_from_cluster(
+    cluster_topics: Dict[str, Optional[Topic]],
+    match_method: str,
+    providers: List[str],
+) -> MatchedTopic:
+    """Build the MatchedTopic for one cluster (steps 5–6 of match_topics)."""
+    active_provider_count = len(providers)
 
-        matched.append(
-            MatchedTopic(
-                canonical_name=canonical,
-                coverage=coverage,
-                agreement_level=agreement,
-                match_method=match_method,
-            )
-        )
+    present_topics = [(p, t) for p, t in cluster_topics.items() if t is not None]
+    canonical = max(
+        (t.heading for _, t in present_topics),
+        key=len,
+    )
 
-    return matched
+    coverage: Dict[str, str] = {}
+    for p in providers:
+        t = cluster_topics.get(p)
+        if t is not None:
+            coverage[p] = t.coverage
+        else:
+            coverage[p] = "absent"
+
+    present_count = sum(1 for v in coverage.values() if v != "absent")
+
+    if active_provider_count == 1:
+        agreement = f"unique-{providers[0]}"
+    elif present_count == active_provider_count:
+        agreement = "consensus"
+    elif present_count >= 2:
+        agreement = "majority"
+    else:
+        only_provider = next(p for p, v in coverage.items() if v != "absent")
+        agreement = f"unique-{only_provider}"
+
+    return MatchedTopic(
+        canonical_name=canonical,
+        coverage=coverage,
+        agreement_level=agreement,
+        match_method=match_method,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -632,22 +796,16 @@ def _compute_citation_overlap(
         Dict mapping URL → sorted list of provider names.
     """
     # Build {url: set of providers}
-    url_providers: Dict[str, Set[str]] = {}
+    url_providers: Dict[str, Set[str]] = defaultdict(set)
 
     for r in results:
-        provider_urls = _extract_urls(r.citations)
-        for url in provider_urls:
-            if url not in url_providers:
-                url_providers[url] = set()
+        for url in _extract_urls(r.citations):
             url_providers[url].add(r.provider)
 
-    # Filter to only multi-provider URLs, sort provider lists for determinism.
-    overlap: Dict[str, List[str]] = {}
-    for url, providers in sorted(url_providers.items()):
-        if len(providers) >= 2:
-            overlap[url] = sorted(providers)
-
-    return overlap
+    # Filter to only multi-provider URLs before sorting, and sort provider
+    # lists for determinism.
+    shared = sorted(url for url, providers in url_providers.items() if len(providers) >= 2)
+    return {url: sorted(url_providers[url]) for url in shared}
 
 
 # ---------------------------------------------------------------------------
@@ -687,66 +845,48 @@ def build_matrix(results: list) -> ComparisonMatrix:
     for r in successful:
         provider_topics[r.provider] = extract_topics(r.report)
 
-    # Match topics across providers (heading-based: exact + fuzzy).
-    matched = match_topics(provider_topics)
-
     # Compute citation overlap.
     citation_overlap = _compute_citation_overlap(successful)
 
-    # Compute stats.
-    consensus_count = sum(1 for t in matched if t.agreement_level == "consensus")
-    majority_count = sum(1 for t in matched if t.agreement_level == "majority")
-    unique_count = sum(1 for t in matched if t.agreement_level.startswith("unique-"))
+    # Match topics across providers (heading-based: exact + fuzzy), then walk
+    # the clusters once to build MatchedTopics, agreement stats and
+    # unmatched_hints together. Unmatched clusters still hold their Topic, so
+    # hint keywords come straight from it with no lookup by heading.
+    matched: List[MatchedTopic] = []
+    stats: Dict[str, Any] = {"total_topics": 0, "consensus": 0, "majority": 0, "unique": 0}
+    unmatched_hints: List[Dict] = []
+    cluster_providers = list(provider_topics.keys())
 
-    stats: Dict[str, Any] = {
-        "total_topics": len(matched),
-        "consensus": consensus_count,
-        "majority": majority_count,
-        "unique": unique_count,
-    }
+    for cluster_topics, match_method in _cluster_topics(provider_topics):
+        t = _matched_topic_from_cluster(cluster_topics, match_method, cluster_providers)
+        matched.append(t)
 
-    # Build unmatched_hints: topics that remain unmatched after heading matching.
-    # Each hint gives the LLM the provider, heading, and top keywords so it
-    # can decide whether to manually merge topics with different headings.
-    # Build a lookup from heading to Topic for each provider.
-    heading_to_topic: Dict[str, Dict[str, Topic]] = {}
-    for p, topics_list in provider_topics.items():
-        for topic in topics_list:
-            if topic.heading not in heading_to_topic:
-                heading_to_topic[topic.heading] = {}
-            heading_to_topic[topic.heading][p] = topic
+        if t.agreement_level == "consensus":
+            stats["consensus"] += 1
+        elif t.agreement_level == "majority":
+            stats["majority"] += 1
+        elif t.agreement_level.startswith("unique-"):
+            stats["unique"] += 1
 
-    unmatched_hints: List[Dict] = []
-    for t in matched:
-        if t.match_method != "unmatched":
+        if match_method != "unmatched":
             continue
-        owning_provider = next(
-            (p for p, cov in t.coverage.items() if cov != "absent"),
-            None,
+        # Each hint gives the LLM the provider, heading, and top keywords so it
+        # can decide whether to manually merge topics with different headings.
+        # top_keywords are the first 20 in sorted order; nsmallest yields the
+        # same list as sorted()[:20] without sorting the whole keyword set.
+        owning_provider, topic_obj = next(
+            (p, topic) for p, topic in cluster_topics.items() if topic is not None
         )
-        if owning_provider is None:
-            continue
-        # Retrieve the Topic object to get body_keywords.
-        topic_obj: Optional[Topic] = next(
-            (
-                topic
-                for topic in provider_topics.get(owning_provider, [])
-                if topic.heading == t.canonical_name
-            ),
-            None,
-        )
-        keywords: List[str] = []
-        if topic_obj is not None and topic_obj.body_keywords:
-            keywords = sorted(topic_obj.body_keywords)[:20]
-
         unmatched_hints.append(
             {
                 "provider": owning_provider,
                 "heading": t.canonical_name,
-                "top_keywords": keywords,
+                "top_keywords": heapq.nsmallest(20, topic_obj.body_keywords),
             }
         )
 
+    stats["total_topics"] = len(matched)
+
     return ComparisonMatrix(
         topics=matched,
         providers=providers,
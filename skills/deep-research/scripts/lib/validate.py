@@ -4,6 +4,11 @@
 inline validation. Four depth levels: 0=none, 1=liveness (HEAD request),
 2=relevance (fetch + text match), 3=cross-reference (fetch + verify claim).
 Uses urllib directly for raw HTTP (not http.py which parses JSON) — stdlib-only.
+Validation is network-bound and runs on a ThreadPoolExecutor in two phases:
+Gemini grounding redirects are resolved first (sequentially per cited host),
+then citations are grouped by the host they resolve to and hosts are checked
+concurrently. Within each phase, requests to a single host stay sequential
+with a 0.2s delay to avoid hammering servers.
 
 Bug fixes in this version:
 - B1: Non-dict citations are now skipped with `continue` instead of raising TypeError
@@ -19,11 +24,39 @@ Features added:
   their final destination before validation, eliminating false negatives
 """
 
+import functools
 import re
+import ssl
 import time
-import urllib.request
 import urllib.error
-from typing import Any, Dict, List
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Set, Tuple
+
+
+@functools.lru_cache(maxsize=None)
+def _opener() -> urllib.request.OpenerDirector:
+    """Shared urllib opener with a single TLS context.
+
+    urlopen() without a context builds a fresh default SSLContext (loading the
+    CA store) for every HTTPS connection. Validation issues many requests, so
+    one context is created on first use and reused by every request and
+    worker thread; otherwise the handler chain matches urlopen's default.
+    """
+    https = urllib.request.HTTPSHandler(context=ssl.create_default_context())
+    return urllib.request.build_opener(https)
+
+
+# Word tokenizer for title/claim keyword matching.
+_WORD_RE = re.compile(r'\w+')
+
+
+@functools.lru_cache(maxsize=256)
+def _markdown_link_pattern(url: str) -> "re.Pattern[str]":
+    """Compiled ``[text](url)`` pattern for an exact URL, cached per URL."""
+    return re.compile(r'\[[^\]]*\]\(' + re.escape(url) + r'\)')
 
 
 def _fetch_raw_html(url: str, timeout: int = 15) -> tuple[str, int]:
@@ -43,7 +76,7 @@ def _fetch_raw_html(url: str, timeout: int = 15) -> tuple[str, int]:
     headers = {"User-Agent": "deep-research-validator/1.0"}
     req = urllib.request.Request(url, headers=headers, method="GET")
 
-    with urllib.request.urlopen(req, timeout=timeout) as response:
+    with _opener().open(req, timeout=timeout) as response:
         body = response.read().decode('utf-8', errors='ignore')
         return body, response.status
 
@@ -65,7 +98,7 @@ def _validate_url_liveness_get(url: str) -> Dict[str, Any]:
         headers = {"User-Agent": "deep-research-validator/1.0"}
         req = urllib.request.Request(url, headers=headers, method="GET")
 
-        with urllib.request.urlopen(req, timeout=10) as response:
+        with _opener().open(req, timeout=10) as response:
             response.read(1024)  # Minimal read — just confirm server responds
             status_code = response.status
             if 200 <= status_code < 400:
@@ -97,7 +130,7 @@ def _validate_url_liveness(url: str) -> Dict[str, Any]:
         headers = {"User-Agent": "deep-research-validator/1.0"}
         req = urllib.request.Request(url, headers=headers, method="HEAD")
 
-        with urllib.request.urlopen(req, timeout=10) as response:
+        with _opener().open(req, timeout=10) as response:
             status_code = response.status
             if 200 <= status_code < 400:
                 return {"status": "valid", "details": f"HTTP {status_code}"}
@@ -118,11 +151,23 @@ def _validate_url_liveness(url: str) -> Dict[str, Any]:
         return {"status": "unreachable", "details": f"{type(e).__name__}: {e}"}
 
 
+# Sentence-ending separators recognised by _extract_surrounding_sentences.
+_SENTENCE_ENDS = (". ", "! ", "? ", "\n\n")
+
+
+def _next_sentence_end(text: str, start: int) -> int:
+    """Index of the earliest sentence separator at or after ``start``, or -1."""
+    found = [i for i in (text.find(sep, start) for sep in _SENTENCE_ENDS) if i != -1]
+    return min(found) if found else -1
+
+
 def _extract_surrounding_sentences(text: str, position: int) -> str:
     """Extract 1-2 sentences surrounding a character position in text.
 
     Finds sentence boundaries (`. `, `! `, `? `, `\\n\\n`) before and after
     the given position and returns up to 500 characters of context.
+    Boundaries are located with str.find/str.rfind rather than a
+    per-character scan.
 
     Args:
         text: Full text to search within
@@ -137,35 +182,20 @@ def _extract_surrounding_sentences(text: str, position: int) -> str:
     # Clamp position to valid range
     position = max(0, min(position, len(text) - 1))
 
-    # Sentence-ending patterns we look for when scanning backwards/forwards
-    sentence_ends = [". ", "! ", "? ", "\n\n"]
-
-    # Find start: scan backwards for a sentence boundary
+    # Find start: the last separator beginning at or before position.
+    # All separators are two characters long.
     start = 0
-    for i in range(position, -1, -1):
-        for sep in sentence_ends:
-            if text[i:i + len(sep)] == sep:
-                start = i + len(sep)
-                break
-        else:
-            continue
-        break
+    last = max(text.rfind(sep, 0, position + len(sep)) for sep in _SENTENCE_ENDS)
+    if last != -1:
+        start = last + 2
 
-    # Find end: scan forwards for 1-2 sentence boundaries
+    # Find end: scan forwards for 1-2 non-overlapping sentence boundaries
     end = len(text)
-    boundaries_found = 0
-    i = position
-    while i < len(text):
-        for sep in sentence_ends:
-            if text[i:i + len(sep)] == sep:
-                boundaries_found += 1
-                if boundaries_found >= 2:
-                    end = i + len(sep)
-                    i = len(text)  # break outer loop
-                    break
-                i += len(sep) - 1  # advance past separator (outer loop adds 1)
-                break
-        i += 1
+    first = _next_sentence_end(text, position)
+    if first != -1:
+        second = _next_sentence_end(text, first + 2)
+        if second != -1:
+            end = second + 2
 
     result = text[start:end].strip()
     # Enforce 500-char cap
@@ -194,17 +224,19 @@ def _extract_claim_context(report: str, url: str, citation_index: int) -> str:
     if not report or not url:
         return ""
 
-    # Strategy 1: URL inside markdown link [text](url)
-    # Match [anything](url) where url is the exact URL
-    escaped_url = re.escape(url)
-    md_pattern = r'\[[^\]]*\]\(' + escaped_url + r'\)'
-    match = re.search(md_pattern, report)
-    if match:
-        return _extract_surrounding_sentences(report, match.start())
-
-    # Strategy 2: URL as bare text
+    # Both URL strategies need the literal URL, so a plain substring search
+    # rules them out before any regex runs.
     pos = report.find(url)
     if pos != -1:
+        # Strategy 1: URL inside markdown link [text](url)
+        # Match [anything](url) where url is the exact URL; only worth a
+        # regex search when the "](url)" tail is present at all.
+        if report.find("](" + url + ")") != -1:
+            match = _markdown_link_pattern(url).search(report)
+            if match:
+                return _extract_surrounding_sentences(report, match.start())
+
+        # Strategy 2: URL as bare text
         return _extract_surrounding_sentences(report, pos)
 
     # Strategy 3: Footnote marker [N] where N = citation_index + 1
@@ -217,6 +249,10 @@ def _extract_claim_context(report: str, url: str, citation_index: int) -> str:
     return ""
 
 
+# Substring identifying Gemini grounding API redirect URLs.
+_GROUNDING_REDIRECT_MARKER = "vertexaisearch.cloud.google.com/grounding-api-redirect"
+
+
 def _resolve_redirects(url: str) -> str:
     """Resolve Gemini grounding API redirect URLs to their final destination.
 
@@ -233,14 +269,14 @@ def _resolve_redirects(url: str) -> str:
         Final resolved URL, or original URL if not a grounding redirect or on error
     """
     # Only process Gemini grounding redirect URLs
-    if "vertexaisearch.cloud.google.com/grounding-api-redirect" not in url:
+    if _GROUNDING_REDIRECT_MARKER not in url:
         return url
 
     try:
         headers = {"User-Agent": "deep-research-validator/1.0"}
         req = urllib.request.Request(url, headers=headers, method="HEAD")
 
-        with urllib.request.urlopen(req, timeout=10) as response:
+        with _opener().open(req, timeout=10) as response:
             # After following redirects, response.url is the final URL
             final_url = response.url
             return final_url if final_url else url
@@ -254,7 +290,7 @@ def _resolve_redirects(url: str) -> str:
                     headers={"User-Agent": "deep-research-validator/1.0"},
                     method="GET",
                 )
-                with urllib.request.urlopen(req_get, timeout=10) as response:
+                with _opener().open(req_get, timeout=10) as response:
                     final_url = response.url
                     return final_url if final_url else url
             except Exception:
@@ -292,7 +328,7 @@ def _validate_url_relevance(url: str, citation_title: str = "") -> Dict[str, Any
                 return {"status": "valid", "details": "Citation title found in page"}
 
             # Try keyword match (at least 50% of words in title)
-            title_words = [w for w in re.findall(r'\w+', title_lower) if len(w) > 3]
+            title_words = [w for w in _WORD_RE.findall(title_lower) if len(w) > 3]
             if title_words:
                 matches = sum(1 for word in title_words if word in html_lower)
                 if matches / len(title_words) >= 0.5:
@@ -333,7 +369,7 @@ def _validate_url_cross_reference(url: str, claim: str = "", citation_title: str
         # Level 3: Check if claim keywords appear in the page
         if claim:
             # Extract keywords from claim (words longer than 3 chars)
-            claim_words = [w for w in re.findall(r'\w+', claim.lower()) if len(w) > 3]
+            claim_words = [w for w in _WORD_RE.findall(claim.lower()) if len(w) > 3]
             if claim_words:
                 matches = sum(1 for word in claim_words if word in html_lower)
                 if matches / len(claim_words) >= 0.6:  # 60% keyword match for claims
@@ -347,7 +383,7 @@ def _validate_url_cross_reference(url: str, claim: str = "", citation_title: str
             if title_lower in html_lower:
                 return {"status": "valid", "details": "Citation title found in page"}
 
-            title_words = [w for w in re.findall(r'\w+', title_lower) if len(w) > 3]
+            title_words = [w for w in _WORD_RE.findall(title_lower) if len(w) > 3]
             if title_words:
                 matches = sum(1 for word in title_words if word in html_lower)
                 if matches / len(title_words) >= 0.5:
@@ -366,9 +402,171 @@ def _validate_url_cross_reference(url: str, claim: str = "", citation_title: str
         return {"status": "unreachable", "details": f"{type(e).__name__}: {e}"}
 
 
+# Maximum number of hosts validated concurrently.
+VALIDATION_MAX_WORKERS = 8
+
+# Delay between consecutive requests to the same host.
+_PER_HOST_DELAY_SECONDS = 0.2
+
+
+def _validate_citation(
+    citation: Dict[str, Any],
+    depth: int,
+    report_text: str,
+    citation_index: int,
+    redirects: Dict[str, str],
+    verdicts: Dict[Tuple[Any, ...], Dict[str, Any]],
+) -> bool:
+    """Resolve, validate, and annotate a single dict citation in place.
+
+    Redirect resolutions and validation verdicts are memoized in the
+    per-invocation ``redirects`` / ``verdicts`` dicts, so a URL cited by
+    several providers (or several times by one) is fetched once per distinct
+    set of validation inputs.
+
+    Args:
+        citation: Citation dict with a non-empty ``url``
+        depth: Validation depth (1=liveness, 2=relevance, 3=cross-ref)
+        report_text: Report the citation came from (for claim context)
+        citation_index: 0-based index of the citation in its provider's list
+        redirects: Memo of url -> resolved_url for this validation run
+        verdicts: Memo of (depth, url, *inputs) -> validation result
+
+    Returns:
+        True if a resolution or validation request may have been issued,
+        False when both the redirect and the verdict came from the memos
+    """
+    url = citation["url"]
+
+    # F2: Resolve Gemini grounding redirects before validation
+    # validate_citations pre-resolves every grounding URL, so this only
+    # resolves (and only counts as a request) when called on its own.
+    resolved_url = redirects.get(url)
+    redirect_miss = resolved_url is None and _GROUNDING_REDIRECT_MARKER in url
+    if resolved_url is None:
+        resolved_url = redirects[url] = _resolve_redirects(url)
+    if resolved_url != url:
+        citation["resolved_url"] = resolved_url
+    validation_url = resolved_url  # Validate against final destination
+
+    # Validate based on depth
+    if depth == 1:
+        key: Tuple[Any, ...] = (depth, validation_url)
+        check = functools.partial(_validate_url_liveness, validation_url)
+    elif depth == 2:
+        title = citation.get("title", "")
+        # F1: Fall back to extracted context when no title
+        if not title:
+            title = _extract_claim_context(report_text, url, citation_index)
+        key = (depth, validation_url, title)
+        check = functools.partial(_validate_url_relevance, validation_url, title)
+    elif depth == 3:
+        title = citation.get("title", "")
+        # B3 + F1: Always extract claim context from report (claim field is never set by providers)
+        claim = _extract_claim_context(report_text, url, citation_index)
+        key = (depth, validation_url, claim, title)
+        check = functools.partial(_validate_url_cross_reference, validation_url, claim, title)
+    else:
+        key = (depth,)
+        check = functools.partial(dict, status="skipped", details="Invalid depth")
+
+    validation = verdicts.get(key)
+    verdict_miss = validation is None
+    if verdict_miss:
+        validation = verdicts[key] = check()
+
+    # Add validation data to citation
+    citation["validation"] = {
+        "status": validation["status"],
+        "depth": depth,
+        "details": validation.get("details", ""),
+    }
+    # A redirect miss may have sent a HEAD even when the verdict was memoized.
+    return redirect_miss or verdict_miss
+
+
+def _url_host(url: str) -> str:
+    """Lower-cased network location used to group requests by host.
+
+    Malformed URLs (e.g. an unclosed IPv6 bracket) make urlsplit raise; they
+    get their own bucket keyed by the raw URL so the per-URL validators still
+    record an "unreachable" verdict instead of aborting the whole run.
+    """
+    try:
+        return urllib.parse.urlsplit(url).netloc.lower()
+    except ValueError:
+        return url
+
+
+def _resolve_host_batch(urls: List[str], redirects: Dict[str, str]) -> None:
+    """Resolve one cited host's grounding URLs sequentially into ``redirects``.
+
+    Args:
+        urls: Distinct grounding redirect URLs sharing a cited host
+        redirects: Shared redirect memo (see _validate_citation)
+    """
+    for i, url in enumerate(urls):
+        if i:
+            # Rate limit: small delay between requests to avoid hammering servers
+            time.sleep(_PER_HOST_DELAY_SECONDS)
+        redirects[url] = _resolve_redirects(url)
+
+
+def _group_jobs_by_host(
+    jobs: List[Tuple[Dict[str, Any], str, int]],
+    redirects: Dict[str, str],
+) -> Dict[str, List[Tuple[Dict[str, Any], str, int]]]:
+    """Bucket validation jobs by the host of their resolved URL.
+
+    Args:
+        jobs: (citation, report_text, citation_index) tuples
+        redirects: Redirect memo filled by the resolution phase
+
+    Returns:
+        Dict of host -> jobs, in first-seen order
+    """
+    host_jobs: Dict[str, List[Tuple[Dict[str, Any], str, int]]] = defaultdict(list)
+    for job in jobs:
+        url = job[0]["url"]
+        host_jobs[_url_host(redirects.get(url, url))].append(job)
+    return host_jobs
+
+
+def _validate_host_batch(
+    jobs: List[Tuple[Dict[str, Any], str, int]],
+    depth: int,
+    redirects: Dict[str, str],
+    verdicts: Dict[Tuple[Any, ...], Dict[str, Any]],
+) -> None:
+    """Validate one host's citations sequentially, pausing between requests.
+
+    Args:
+        jobs: (citation, report_text, citation_index) tuples sharing a host
+        depth: Validation depth
+        redirects: Shared redirect memo (see _validate_citation)
+        verdicts: Shared verdict memo (see _validate_citation)
+    """
+    requested = False
+    for citation, report_text, citation_index in jobs:
+        if requested:
+            # Rate limit: small delay between requests to avoid hammering servers
+            time.sleep(_PER_HOST_DELAY_SECONDS)
+        requested = _validate_citation(
+            citation, depth, report_text, citation_index, redirects, verdicts
+        )
+
+
 def validate_citations(results: List[Any], depth: int = 0) -> List[Any]:
     """Validate citations in provider results.
 
+    Gemini grounding redirects are resolved first, one sequential batch per
+    cited host. Citations are then grouped by the host of their resolved URL,
+    so grounding citations spread across their real destinations and share a
+    batch with direct citations of the same host. Both phases run hosts
+    concurrently on up to VALIDATION_MAX_WORKERS threads, while requests to the
+    same host stay sequential with a short delay between them, so overall
+    latency tracks the slowest host rather than the sum of every request.
+
     Args:
         results: List of ProviderResult objects (as dicts or dataclasses)
         depth: Validation depth (0=none, 1=liveness, 2=relevance, 3=cross-ref)
@@ -379,6 +577,8 @@ def validate_citations(results: List[Any], depth: int = 0) -> List[Any]:
     if depth == 0:
         return results
 
+    jobs: List[Tuple[Dict[str, Any], str, int]] = []
+
     for result in results:
         # Get direct reference to citations list
         if hasattr(result, "citations"):
@@ -413,37 +613,39 @@ def validate_citations(results: List[Any], depth: int = 0) -> List[Any]:
                 }
                 continue
 
-            # F2: Resolve Gemini grounding redirects before validation
-            resolved_url = _resolve_redirects(url)
-            if resolved_url != url:
-                citation["resolved_url"] = resolved_url
-            validation_url = resolved_url  # Validate against final destination
-
-            # Validate based on depth
-            if depth == 1:
-                validation = _validate_url_liveness(validation_url)
-            elif depth == 2:
-                title = citation.get("title", "")
-                # F1: Fall back to extracted context when no title
-                if not title:
-                    title = _extract_claim_context(report_text, url, citation_index)
-                validation = _validate_url_relevance(validation_url, title)
-            elif depth == 3:
-                title = citation.get("title", "")
-                # B3 + F1: Always extract claim context from report (claim field is never set by providers)
-                claim = _extract_claim_context(report_text, url, citation_index)
-                validation = _validate_url_cross_reference(validation_url, claim, title)
-            else:
-                validation = {"status": "skipped", "details": "Invalid depth"}
+            jobs.append((citation, report_text, citation_index))
 
-            # Add validation data to citation
-            citation["validation"] = {
-                "status": validation["status"],
-                "depth": depth,
-                "details": validation.get("details", ""),
-            }
+    if not jobs:
+        return results
 
-            # Rate limit: small delay between requests to avoid hammering servers
-            time.sleep(0.2)
+    # Per-invocation memos: identical URLs are resolved and validated once.
+    # Workers share them (dict get/set is atomic); batches are keyed by
+    # resolved host, so citations sharing a resolved URL share a batch.
+    redirects: Dict[str, str] = {}
+    verdicts: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+
+    # F2: distinct grounding URLs, grouped by the host they were cited on.
+    pending: Dict[str, List[str]] = defaultdict(list)
+    seen: Set[str] = set()
+    for citation, _, _ in jobs:
+        url = citation["url"]
+        if _GROUNDING_REDIRECT_MARKER in url and url not in seen:
+            seen.add(url)
+            pending[_url_host(url)].append(url)
+
+    with ThreadPoolExecutor(max_workers=VALIDATION_MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(_resolve_host_batch, urls, redirects)
+            for urls in pending.values()
+        ]
+        for future in futures:
+            future.result()
+
+        futures = [
+            executor.submit(_validate_host_batch, host_batch, depth, redirects, verdicts)
+            for host_batch in _group_jobs_by_host(jobs, redirects).values()
+        ]
+        for future in futures:
+            future.result()
 
     return results
@@ -17,6 +17,7 @@ Strategy:
 import json
 import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Set
 
@@ -25,12 +26,14 @@ SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
 sys.path.insert(0, str(SCRIPTS_DIR))
 
 from lib.matrix import (  # noqa: E402
+    _HEADING_VOCAB,
     STOP_WORDS,
     ComparisonMatrix,
     MatchedTopic,
     Topic,
     _extract_body_keywords,
     _extract_urls,  # noqa: F401 — used in TestExtractUrlsResolvedUrl
+    _heading_jaccard,
     _jaccard_similarity,
     _jaccard_similarity_sets,
     _normalize_heading,
@@ -131,6 +134,52 @@ class TestJaccardSimilarity(unittest.TestCase):
         self.assertAlmostEqual(_jaccard_similarity("a b", "a b c"), 2 / 3, places=5)
 
 
+# ---------------------------------------------------------------------------
+# _heading_jaccard
+# ---------------------------------------------------------------------------
+
+
+class TestHeadingJaccard(unittest.TestCase):
+    """Bitset heading Jaccard must agree with the string-based implementation."""
+
+    def _make_topic(self, heading: str) -> Topic:
+        return Topic(
+            heading=heading,
+            raw_heading=heading,
+            level=2,
+            word_count=0,
+            coverage="mentioned",
+            citations_in_section=0,
+        )
+
+    def test_matches_string_jaccard(self):
+        pairs = [
+            ("apt group connections overview", "apt group connections analysis"),
+            ("company overview", "company background"),
+            ("key findings", "key findings"),
+            ("quantum computing", "regulatory compliance"),
+            ("", ""),
+            ("", "key findings"),
+            ("b links findings", "Findings Company Links B Key"),
+        ]
+        for a, b in pairs:
+            with self.subTest(a=a, b=b):
+                self.assertAlmostEqual(
+                    _heading_jaccard(self._make_topic(a), self._make_topic(b)),
+                    _jaccard_similarity(a, b),
+                )
+
+    def test_concurrent_construction_assigns_distinct_bits(self):
+        """Topics built on several threads never share a bit between words."""
+        headings = [f"concurrentword{t}x{i}" for t in range(8) for i in range(50)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            topics = list(executor.map(self._make_topic, headings))
+
+        positions = [_HEADING_VOCAB[h] for h in headings]
+        self.assertEqual(len(set(positions)), len(positions))
+        self.assertEqual(len({t.heading_bits for t in topics}), len(topics))
+
+
 # ---------------------------------------------------------------------------
 # extract_topics
 # ---------------------------------------------------------------------------
@@ -163,42 +212,43 @@ affected organizations throughout the affected regions worldwide.
 
 """
 
+    @classmethod
+    def setUpClass(cls):
+        # Extraction is deterministic and no test mutates the topics, so the
+        # shared report is parsed once for the whole class.
+        cls.topics = extract_topics(cls.SIMPLE_REPORT)
+        cls.by_heading = {t.heading: t for t in cls.topics}
+
     def test_finds_all_headings(self):
-        topics = extract_topics(self.SIMPLE_REPORT)
-        headings = [t.heading for t in topics]
+        headings = [t.heading for t in self.topics]
         self.assertIn("company overview", headings)
         self.assertIn("key findings", headings)
         self.assertIn("impact and aftermath", headings)
 
     def test_raw_heading_preserved(self):
-        topics = extract_topics(self.SIMPLE_REPORT)
-        overviews = [t for t in topics if t.heading == "company overview"]
+        overviews = [t for t in self.topics if t.heading == "company overview"]
         self.assertEqual(len(overviews), 1)
         self.assertEqual(overviews[0].raw_heading, "Company Overview")
 
     def test_heading_level_h1(self):
-        topics = extract_topics(self.SIMPLE_REPORT)
-        overview = next(t for t in topics if t.heading == "company overview")
-        self.assertEqual(overview.level, 1)
+        self.assertEqual(self.by_heading["company overview"].level, 1)
 
     def test_heading_level_h2(self):
-        topics = extract_topics(self.SIMPLE_REPORT)
-        findings = next(t for t in topics if t.heading == "key findings")
-        self.assertEqual(findings.level, 2)
+        self.assertEqual(self.by_heading["key findings"].level, 2)
 
     def test_coverage_mentioned_short_section(self):
-        topics = extract_topics(self.SIMPLE_REPORT)
-        findings = next(t for t in topics if t.heading == "key findings")
-        self.assertEqual(findings.coverage, "mentioned")
+        self.assertEqual(self.by_heading["key findings"].coverage, "mentioned")
 
     def test_coverage_detailed_long_section(self):
-        topics = extract_topics(self.SIMPLE_REPORT)
-        impact = next(t for t in topics if t.heading == "impact and aftermath")
-        self.assertEqual(impact.coverage, "detailed")
+        self.assertEqual(self.by_heading["impact and aftermath"].coverage, "detailed")
+
+    def test_heading_tokens_derived_from_heading(self):
+        impact = self.by_heading["impact and aftermath"]
+        self.assertEqual(impact.heading_tokens, frozenset({"impact", "and", "aftermath"}))
+        self.assertEqual(impact.heading_len, 3)
 
     def test_word_count_positive(self):
-        topics = extract_topics(self.SIMPLE_REPORT)
-        for t in topics:
+        for t in self.topics:
             self.assertGreaterEqual(t.word_count, 0)
 
     def test_empty_report_returns_empty_list(self):
@@ -217,9 +267,8 @@ affected organizations throughout the affected regions worldwide.
 
 See https://example.com/paper1 and https://example.org/doc2 for details.
 """
-        topics = extract_topics(report)
-        refs = next(t for t in topics if t.heading == "references")
-        self.assertEqual(refs.citations_in_section, 2)
+        by_heading = {t.heading: t for t in extract_topics(report)}
+        self.assertEqual(by_heading["references"].citations_in_section, 2)
 
     def test_h4_headings_extracted(self):
         report = """#### Deep Nested Section
@@ -329,14 +378,8 @@ class TestMatchTopics(unittest.TestCase):
             "openai": [self._make_topic("Company Overview"), self._make_topic("Key Findings")],
             "perplexity": [self._make_topic("Company Overview")],
         }
-        matched = match_topics(topics)
-        # Find the Key Findings topic
-        findings = next(
-            m
-            for m in matched
-            if "findings" in m.canonical_name or "key findings" in m.canonical_name
-        )
-        self.assertEqual(findings.coverage.get("perplexity"), "absent")
+        by_name = {m.canonical_name: m for m in match_topics(topics)}
+        self.assertEqual(by_name["key findings"].coverage.get("perplexity"), "absent")
 
     def test_single_provider_all_unique(self):
         topics = {
@@ -349,6 +392,22 @@ class TestMatchTopics(unittest.TestCase):
         for m in matched:
             self.assertEqual(m.agreement_level, "unique-openai")
 
+    def test_single_contributing_provider_keeps_every_topic_separate(self):
+        """Only one provider has topics: no clustering, absent elsewhere."""
+        topics = {
+            "openai": [
+                self._make_topic("Company Overview"),
+                self._make_topic("Company Overview"),
+            ],
+            "perplexity": [],
+        }
+        matched = match_topics(topics)
+        self.assertEqual(len(matched), 2)
+        for m in matched:
+            self.assertEqual(m.match_method, "unmatched")
+            self.assertEqual(m.agreement_level, "unique-openai")
+            self.assertEqual(m.coverage["perplexity"], "absent")
+
     def test_empty_providers_dict(self):
         matched = match_topics({})
         self.assertEqual(matched, [])
@@ -500,11 +559,14 @@ Multiple security firms contributed research to this topic and
 their findings are synthesized here.
 """
 
-    def setUp(self):
-        self.results = [
+    @classmethod
+    def setUpClass(cls):
+        # build_matrix is deterministic and no test mutates the result, so the
+        # shared three-provider matrix is built once for the whole class.
+        cls.results = [
             _provider_result(
                 "openai",
-                self.OPENAI_REPORT,
+                cls.OPENAI_REPORT,
                 citations=[
                     {"url": "https://example.com/shared"},
                     {"url": "https://openai-only.com/paper"},
@@ -512,7 +574,7 @@ their findings are synthesized here.
             ),
             _provider_result(
                 "perplexity",
-                self.PERPLEXITY_REPORT,
+                cls.PERPLEXITY_REPORT,
                 citations=[
                     {"url": "https://example.com/shared"},
                     {"url": "https://perplexity-only.com/doc"},
@@ -520,14 +582,14 @@ their findings are synthesized here.
             ),
             _provider_result(
                 "gemini",
-                self.GEMINI_REPORT,
+                cls.GEMINI_REPORT,
                 citations=[
                     {"url": "https://example.com/shared"},
                     {"url": "https://gemini-only.com/report"},
                 ],
             ),
         ]
-        self.matrix = build_matrix(self.results)
+        cls.matrix = build_matrix(cls.results)
 
     def test_returns_comparison_matrix(self):
         self.assertIsInstance(self.matrix, ComparisonMatrix)
@@ -567,8 +629,6 @@ their findings are synthesized here.
         self.assertEqual(parts, total)
 
     def test_to_dict_produces_json_serializable_output(self):
-        import json
-
         d = self.matrix.to_dict()
         # Should not raise
         serialized = json.dumps(d)
@@ -627,7 +687,19 @@ their findings are synthesized here.
 class TestFixtureIntegration(unittest.TestCase):
     """Run build_matrix against the real sample fixture files."""
 
-    def _load_provider_result(self, fixture_name: str) -> ProviderResult:
+    @classmethod
+    def setUpClass(cls):
+        # Fixtures are read-only inputs and build_matrix is deterministic, so
+        # parse the JSON and build the matrix once for the whole class.
+        cls.results = [
+            cls._load_provider_result("openai_sample.json"),
+            cls._load_provider_result("perplexity_sample.json"),
+            cls._load_provider_result("gemini_sample.json"),
+        ]
+        cls.matrix = build_matrix(cls.results)
+
+    @classmethod
+    def _load_provider_result(cls, fixture_name: str) -> ProviderResult:
         data = _load_fixture(fixture_name)
         provider = fixture_name.replace("_sample.json", "")
         return ProviderResult(
@@ -640,25 +712,14 @@ class TestFixtureIntegration(unittest.TestCase):
         )
 
     def test_build_matrix_with_fixtures(self):
-        results = [
-            self._load_provider_result("openai_sample.json"),
-            self._load_provider_result("perplexity_sample.json"),
-            self._load_provider_result("gemini_sample.json"),
-        ]
-        matrix = build_matrix(results)
+        matrix = self.matrix
         self.assertIsInstance(matrix, ComparisonMatrix)
         self.assertEqual(set(matrix.providers), {"openai", "perplexity", "gemini"})
         self.assertGreater(len(matrix.topics), 0)
 
     def test_fixture_topics_have_valid_coverage(self):
-        results = [
-            self._load_provider_result("openai_sample.json"),
-            self._load_provider_result("perplexity_sample.json"),
-            self._load_provider_result("gemini_sample.json"),
-        ]
-        matrix = build_matrix(results)
         valid_levels = {"detailed", "mentioned", "absent"}
-        for t in matrix.topics:
+        for t in self.matrix.topics:
             for provider, level in t.coverage.items():
                 self.assertIn(
                     level,
@@ -667,29 +728,15 @@ class TestFixtureIntegration(unittest.TestCase):
                 )
 
     def test_fixture_stats_sanity(self):
-        results = [
-            self._load_provider_result("openai_sample.json"),
-            self._load_provider_result("perplexity_sample.json"),
-            self._load_provider_result("gemini_sample.json"),
-        ]
-        matrix = build_matrix(results)
-        stats = matrix.stats
+        stats = self.matrix.stats
         self.assertGreater(stats["total_topics"], 0)
         self.assertGreaterEqual(stats["consensus"], 0)
         self.assertGreaterEqual(stats["majority"], 0)
         self.assertGreaterEqual(stats["unique"], 0)
 
     def test_fixture_serializes_to_json(self):
-        import json
-
-        results = [
-            self._load_provider_result("openai_sample.json"),
-            self._load_provider_result("perplexity_sample.json"),
-            self._load_provider_result("gemini_sample.json"),
-        ]
-        matrix = build_matrix(results)
         # Should not raise
-        serialized = json.dumps(matrix.to_dict())
+        serialized = json.dumps(self.matrix.to_dict())
         self.assertGreater(len(serialized), 10)
 
 
@@ -770,6 +817,12 @@ class TestJaccardSimilaritySets(unittest.TestCase):
     def test_both_empty(self):
         self.assertAlmostEqual(_jaccard_similarity_sets(set(), set()), 1.0)
 
+    def test_same_object(self):
+        shared = {"semiconductor", "supply", "chain"}
+        self.assertAlmostEqual(_jaccard_similarity_sets(shared, shared), 1.0)
+        empty: Set[str] = set()
+        self.assertAlmostEqual(_jaccard_similarity_sets(empty, empty), 1.0)
+
     def test_one_empty(self):
         self.assertAlmostEqual(_jaccard_similarity_sets(set(), {"a"}), 0.0)
         self.assertAlmostEqual(_jaccard_similarity_sets({"a"}, set()), 0.0)
@@ -832,6 +885,31 @@ class TestMatchMethodTracking(unittest.TestCase):
         self.assertEqual(len(matched), 1)
         self.assertEqual(matched[0].match_method, "heading-fuzzy")
 
+    def test_reordered_heading_words_take_first_perfect_candidate(self):
+        """A reordered heading is a perfect word-set match and is taken over later candidates."""
+        topics = {
+            "openai": [self._make_topic("Group Connections")],
+            "gemini": [
+                self._make_topic("Group Connections Notes"),
+                self._make_topic("Connections Group"),
+                self._make_topic("Group Connections Overview"),
+            ],
+        }
+        matched = match_topics(topics)
+        self.assertEqual(len(matched), 3)
+        leftovers = {m.canonical_name for m in matched[1:]}
+        self.assertEqual(leftovers, {"group connections notes", "group connections overview"})
+
+    def test_contained_heading_at_size_ratio_threshold_still_matches(self):
+        """A 3-word heading inside a 5-word one scores exactly 3/5 = 0.60 and matches."""
+        topics = {
+            "openai": [self._make_topic("Supply Chain Risks")],
+            "gemini": [self._make_topic("Supply Chain Risks Semiconductor Manufacturing")],
+        }
+        matched = match_topics(topics)
+        self.assertEqual(len(matched), 1)
+        self.assertEqual(matched[0].match_method, "heading-fuzzy")
+
     def test_unmatched_method_label_when_no_match(self):
         """Completely disjoint topics produce match_method='unmatched'."""
         topics = {
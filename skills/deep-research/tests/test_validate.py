@@ -7,10 +7,16 @@ inspection and with https://example.com (a stable test URL that always returns 2
 We verify the validation framework, not individual URL availability.
 New tests cover B1 (non-dict citation), B2 (HEAD 405 fallback), B3 (depth 3 claim
 extraction), F1 (extract_claim_context), and F2 (resolve_redirects).
+Request counting uses a local http.server that records hits per path, so memo
+behavior is observed on the wire rather than through patched functions.
 """
 
 import sys
+import threading
+import time
 import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 # Add lib to path
@@ -19,9 +25,11 @@ sys.path.insert(0, str(SCRIPT_DIR))
 
 from lib.render import ProviderResult
 from lib.validate import (
+    _PER_HOST_DELAY_SECONDS,
     validate_citations,
     _extract_claim_context,
     _extract_surrounding_sentences,
+    _group_jobs_by_host,
     _resolve_redirects,
     _validate_url_liveness_get,
 )
@@ -131,6 +139,29 @@ class TestValidateCitations(unittest.TestCase):
         citation = validated[0].citations[0]
         self.assertIn(citation["validation"]["status"], ["invalid", "unreachable", "skipped"])
 
+    def test_unparseable_url_does_not_abort_other_citations(self):
+        """A URL urlsplit rejects is marked unreachable; its neighbours are still validated."""
+        results = [
+            ProviderResult(
+                provider="openai",
+                success=True,
+                report="test report",
+                citations=[
+                    {"url": "http://[not-an-ipv6/page", "title": "Broken"},
+                    {"url": "https://example.com", "title": "Example"},
+                ],
+                model="o1",
+                elapsed_seconds=10.0,
+            )
+        ]
+
+        validated = validate_citations(results, depth=1)
+
+        broken, example = validated[0].citations
+        self.assertEqual(broken["validation"]["status"], "unreachable")
+        self.assertIn("ValueError", broken["validation"]["details"])
+        self.assertIn("validation", example)
+
     def test_validation_adds_correct_depth(self):
         """Validation adds correct depth to each citation."""
         for depth in [1, 2, 3]:
@@ -453,6 +484,168 @@ class TestValidateCitations(unittest.TestCase):
         self.assertNotIn("resolved_url", citation)
 
 
+class _CountingHandler(BaseHTTPRequestHandler):
+    """Serves /page and a fake grounding redirect, counting hits per path."""
+
+    hits: Counter = Counter()
+    arrivals: list = []  # (path, monotonic time) per request
+    lock = threading.Lock()
+
+    def _respond(self, body: bool) -> None:
+        with self.lock:
+            self.hits[self.path] += 1
+            self.arrivals.append((self.path, time.monotonic()))
+        if "grounding-api-redirect" in self.path:
+            host, port = self.server.server_address[:2]
+            self.send_response(302)
+            self.send_header("Location", f"http://{host}:{port}/page")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        payload = b"<html><title>Example Domain</title><body>Example Domain</body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if body:
+            self.wfile.write(payload)
+
+    def do_HEAD(self):
+        self._respond(body=False)
+
+    def do_GET(self):
+        self._respond(body=True)
+
+    def log_message(self, format, *args):  # silence request logging
+        pass
+
+
+class TestValidationRequestCounts(unittest.TestCase):
+    """Memoization observed as request counts against a local server."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _CountingHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _CountingHandler.hits.clear()
+        _CountingHandler.arrivals.clear()
+
+    def _results(self, url, providers=("openai", "perplexity", "gemini")):
+        return [
+            ProviderResult(
+                provider=provider,
+                success=True,
+                report="test report",
+                citations=[{"url": url, "title": "Example Domain"}],
+                model="o1",
+                elapsed_seconds=10.0,
+            )
+            for provider in providers
+        ]
+
+    def test_url_cited_by_three_providers_is_fetched_once(self):
+        """A URL shared across providers is requested once and every citation annotated."""
+        validated = validate_citations(self._results(f"{self.base}/page"), depth=1)
+
+        self.assertEqual(_CountingHandler.hits["/page"], 1)
+        for result in validated:
+            self.assertEqual(result.citations[0]["validation"]["status"], "valid")
+
+    def test_repeated_grounding_url_is_resolved_once(self):
+        """A grounding redirect cited twice is resolved once and its target validated once."""
+        redirect_path = "/vertexaisearch.cloud.google.com/grounding-api-redirect/abc"
+        validated = validate_citations(
+            self._results(self.base + redirect_path, providers=("gemini", "openai")),
+            depth=1,
+        )
+
+        self.assertEqual(_CountingHandler.hits[redirect_path], 1)
+        # One GET while following the redirect, one HEAD for liveness.
+        self.assertEqual(_CountingHandler.hits["/page"], 2)
+        for result in validated:
+            citation = result.citations[0]
+            self.assertEqual(citation["resolved_url"], f"{self.base}/page")
+            self.assertEqual(citation["validation"]["status"], "valid")
+
+    def test_citations_on_two_hosts_are_each_validated(self):
+        """Citations on different hosts are validated in separate batches and annotated individually."""
+        port = self.server.server_address[1]
+        urls = [f"http://127.0.0.1:{port}/page", f"http://localhost:{port}/page"]
+        results = [
+            ProviderResult(
+                provider="openai",
+                success=True,
+                report="test report",
+                citations=[{"url": url, "title": "Example Domain"} for url in urls],
+                model="o1",
+                elapsed_seconds=10.0,
+            )
+        ]
+
+        validated = validate_citations(results, depth=1)
+
+        self.assertEqual(_CountingHandler.hits["/page"], 2)
+        first, second = validated[0].citations
+        self.assertEqual(first["validation"]["status"], "valid")
+        self.assertEqual(second["validation"]["status"], "valid")
+        self.assertIsNot(first["validation"], second["validation"])
+
+    def test_redirect_resolutions_are_spaced_by_host_delay(self):
+        """Distinct grounding URLs with a shared target still pause between resolutions."""
+        paths = [
+            f"/vertexaisearch.cloud.google.com/grounding-api-redirect/g{i}" for i in range(3)
+        ]
+        results = [
+            ProviderResult(
+                provider="gemini",
+                success=True,
+                report="test report",
+                citations=[{"url": self.base + path, "title": "Example Domain"} for path in paths],
+                model="gemini",
+                elapsed_seconds=10.0,
+            )
+        ]
+
+        validate_citations(results, depth=1)
+
+        times = [t for path, t in _CountingHandler.arrivals if "grounding-api-redirect" in path]
+        self.assertEqual(len(times), 3)
+        for earlier, later in zip(times, times[1:]):
+            self.assertGreaterEqual(later - earlier, _PER_HOST_DELAY_SECONDS * 0.9)
+
+
+class TestGroupJobsByHost(unittest.TestCase):
+    """Validation batches are keyed by the resolved host, not the cited one."""
+
+    def test_grounding_citation_joins_its_target_host(self):
+        grounding = "https://vertexaisearch.cloud.google.com/grounding-api-redirect/abc"
+        jobs = [
+            ({"url": grounding}, "", 0),
+            ({"url": "https://Example.com/other"}, "", 1),
+            ({"url": "https://example.org/"}, "", 2),
+        ]
+        redirects = {grounding: "https://example.com/article"}
+
+        host_jobs = _group_jobs_by_host(jobs, redirects)
+
+        self.assertEqual(list(host_jobs), ["example.com", "example.org"])
+        self.assertEqual([job[2] for job in host_jobs["example.com"]], [0, 1])
+
+    def test_unresolved_grounding_url_stays_on_its_own_host(self):
+        grounding = "https://vertexaisearch.cloud.google.com/grounding-api-redirect/abc"
+        host_jobs = _group_jobs_by_host([({"url": grounding}, "", 0)], {})
+        self.assertEqual(list(host_jobs), ["vertexaisearch.cloud.google.com"])
+
+
 class TestValidationFunctionSignatures(unittest.TestCase):
     """Test that validation helper functions exist with correct signatures."""
 